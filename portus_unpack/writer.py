@@ -1,4 +1,5 @@
 # portus_unpack/writer.py
+import hashlib
 import json
 import re
 import sys
@@ -41,6 +42,35 @@ def ensure_output_folder(base: str | None, provider: str) -> Path:
         sys.exit(f"❌  cannot write to {path}\n{e}")
     return path
 
+# ───────────────────────── manifest ───────────────────────────────────────
+def _manifest_path(output_dir: Path, ts_stamp: str) -> Path:
+    return output_dir / f"manifest_{ts_stamp}.jsonl"
+
+
+def _manifest_entry(part, prov, slug, fmt, idx, total, tokens, n_msgs):
+    return OrderedDict([
+        ("id",          _provider_id(part, prov)),
+        ("slug",        slug),
+        ("created",     _provider_created(part, prov)),
+        ("updated",     _provider_updated(part, prov)),
+        ("format",      fmt),
+        ("part",        idx),
+        ("total_parts", total),
+        ("tokens",      tokens),
+        ("messages",    n_msgs),
+    ])
+
+
+def _write_part(path: Path, text: str, output_dir: Path, manifest, entry):
+    """Write one part file and append its manifest line (size + sha256 of the bytes on disk)."""
+    data = text.encode("utf-8")
+    path.write_bytes(data)
+    entry["bytes"] = len(data)
+    entry["path"] = path.relative_to(output_dir).as_posix()
+    entry["sha256"] = hashlib.sha256(data).hexdigest()
+    manifest.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    manifest.flush()
+
 # ───────────────────────── core iterator ──────────────────────────────────
 def _iter_conversations(raw, prov, inc_time, inc_model):
     adapt = get_adapter(prov)
@@ -68,43 +98,70 @@ def write_json_conversations(raw_convs, provider, output_dir,
     written = skipped = 0
     ts_stamp = output_dir.name.split(f"{provider}-")[-1]
     index_file = output_dir / f"index_{ts_stamp}.txt"
+    manifest_file = _manifest_path(output_dir, ts_stamp)
     folders: list[str] = []
 
-    for n, (base, msgs) in enumerate(
-            _iter_conversations(raw_convs, provider,
-                                include_time, include_model), 1):
-
-        folder_num = f"{n:03d}"
-        slug = _slug(_provider_title(base, provider) or "untitled")
-        sub = output_dir / f"{folder_num}_{slug}_{export_tag}"
-        sub.mkdir(exist_ok=True)
-        folders.append(sub.name)
-
-        key = "chat_messages" if "chat_messages" in base else "messages"
-        full = base.copy(); full[key] = msgs
-        parts = split_conversation(provider, full, max_tokens)
-        if not parts:
-            skipped += 1
-            if progress_cb: progress_cb()
-            continue
+    with manifest_file.open("a", encoding="utf-8") as manifest:
+        for n, (base, msgs) in enumerate(
+                _iter_conversations(raw_convs, provider,
+                                    include_time, include_model), 1):
+
+            folder_num = f"{n:03d}"
+            slug = _slug(_provider_title(base, provider) or "untitled")
+            sub = output_dir / f"{folder_num}_{slug}_{export_tag}"
+            sub.mkdir(exist_ok=True)
+            folders.append(sub.name)
+
+            key = "chat_messages" if "chat_messages" in base else "messages"
+            full = base.copy(); full[key] = msgs
+            parts = split_conversation(provider, full, max_tokens)
+            if not parts:
+                skipped += 1
+                if progress_cb: progress_cb()
+                continue
+
+            total = len(parts)
+            for idx, part in enumerate(parts, 1):
+                meta = part.pop("meta")
+                od = _inject_meta(part, key, part[key], idx, total, meta["tokens"])
+                fname = f"{folder_num}_{slug}_{idx}.json"
+                entry = _manifest_entry(part, provider, slug, "json", idx, total,
+                                        meta["tokens"], len(part[key]))
+                _write_part(sub / fname, json.dumps(od, ensure_ascii=False, indent=2),
+                            output_dir, manifest, entry)
+                written += 1
 
-        for idx, part in enumerate(parts, 1):
-            meta = part.pop("meta")
-            od = _inject_meta(part, key, part[key], idx, len(parts), meta["tokens"])
-            fname = f"{folder_num}_{slug}_{idx}.json"
-            with (sub / fname).open("w", encoding="utf-8") as fh:
-                json.dump(od, fh, ensure_ascii=False, indent=2)
-            written += 1
-
-        if progress_cb: progress_cb()
+            if progress_cb: progress_cb()
 
     index_file.write_text("\n".join(folders), encoding="utf-8")
     log(f"📄  Exported {written} JSON part(s).  Skipped {skipped}.")
     log(f"📁  Index: {index_file.name}")
+    log(f"🧾  Manifest: {manifest_file.name}")
     return written
 
 
 # ---------------------------------------------------------------------- MD
+def _render_md(part, provider, key, idx, total, tokens):
+    title   = _provider_title(part, provider) or "untitled"
+    cid     = _provider_id(part, provider)
+    created = _provider_created(part, provider)
+    updated = _provider_updated(part, provider)
+
+    out = [f"# {title}\n",
+           f"**ID:** {cid}\n",
+           f"**Created:** {created}\n",
+           f"**Updated:** {updated}\n",
+           f"**Part:** {idx}/{total}\n",
+           f"**Tokens:** {tokens}\n---\n\n"]
+    for msg in part[key]:
+        role_key = "role" if provider == "ChatGPT" else "sender"
+        role = msg.get(role_key, "").capitalize()
+        text = msg.get("text", "")
+        out.append(f"**{role}:**\n")
+        out.append(f"```\n{text}\n```\n\n" if "\n" in text or len(text) > 200 else f"{text}\n\n")
+    return "".join(out)
+
+
 def write_md_conversations(raw_convs, provider, output_dir,
                            include_time=False, include_model=False,
                            max_tokens=None, export_tag="MD",
@@ -113,53 +170,42 @@ def write_md_conversations(raw_convs, provider, output_dir,
     written = skipped = 0
     ts_stamp = output_dir.name.split(f"{provider}-")[-1]
     index_file = output_dir / f"index_{ts_stamp}.txt"
+    manifest_file = _manifest_path(output_dir, ts_stamp)
     folders: list[str] = []
 
-    for n, (base, msgs) in enumerate(
-            _iter_conversations(raw_convs, provider,
-                                include_time, include_model), 1):
-
-        folder_num = f"{n:03d}"
-        slug = _slug(_provider_title(base, provider) or "untitled")
-        sub = output_dir / f"{folder_num}_{slug}_{export_tag}"
-        sub.mkdir(exist_ok=True)
-        folders.append(sub.name)
-
-        key = "chat_messages" if "chat_messages" in base else "messages"
-        full = base.copy(); full[key] = msgs
-        parts = split_conversation(provider, full, max_tokens)
-        if not parts:
-            skipped += 1
-            if progress_cb: progress_cb()
-            continue
+    with manifest_file.open("a", encoding="utf-8") as manifest:
+        for n, (base, msgs) in enumerate(
+                _iter_conversations(raw_convs, provider,
+                                    include_time, include_model), 1):
+
+            folder_num = f"{n:03d}"
+            slug = _slug(_provider_title(base, provider) or "untitled")
+            sub = output_dir / f"{folder_num}_{slug}_{export_tag}"
+            sub.mkdir(exist_ok=True)
+            folders.append(sub.name)
+
+            key = "chat_messages" if "chat_messages" in base else "messages"
+            full = base.copy(); full[key] = msgs
+            parts = split_conversation(provider, full, max_tokens)
+            if not parts:
+                skipped += 1
+                if progress_cb: progress_cb()
+                continue
+
+            total = len(parts)
+            for idx, part in enumerate(parts, 1):
+                meta = part.pop("meta")
+                fname = f"{folder_num}_{slug}_{idx}.md"
+                entry = _manifest_entry(part, provider, slug, "md", idx, total,
+                                        meta["tokens"], len(part[key]))
+                _write_part(sub / fname, _render_md(part, provider, key, idx, total, meta["tokens"]),
+                            output_dir, manifest, entry)
+                written += 1
 
-        total = len(parts)
-        for idx, part in enumerate(parts, 1):
-            meta = part.pop("meta")
-            title   = _provider_title(part, provider) or "untitled"
-            cid     = _provider_id(part, provider)
-            created = _provider_created(part, provider)
-            updated = _provider_updated(part, provider)
-
-            fname = f"{folder_num}_{slug}_{idx}.md"
-            with (sub / fname).open("w", encoding="utf-8") as fh:
-                fh.write(f"# {title}\n")
-                fh.write(f"**ID:** {cid}\n")
-                fh.write(f"**Created:** {created}\n")
-                fh.write(f"**Updated:** {updated}\n")
-                fh.write(f"**Part:** {idx}/{total}\n")
-                fh.write(f"**Tokens:** {meta['tokens']}\n---\n\n")
-                for msg in part[key]:
-                    role_key = "role" if provider == "ChatGPT" else "sender"
-                    role = msg.get(role_key, "").capitalize()
-                    text = msg.get("text", "")
-                    fh.write(f"**{role}:**\n")
-                    fh.write(f"```\n{text}\n```\n\n" if "\n" in text or len(text) > 200 else f"{text}\n\n")
-            written += 1
-
-        if progress_cb: progress_cb()
+            if progress_cb: progress_cb()
 
     index_file.write_text("\n".join(folders), encoding="utf-8")
     log(f"📝  Exported {written} Markdown file(s).  Skipped {skipped}.")
     log(f"📁  Index: {index_file.name}")
+    log(f"🧾  Manifest: {manifest_file.name}")
     return written